@@ -1,9 +1,70 @@
 import heapq
+import itertools
 import math
+import multiprocessing
+import os
 import random
-from typing import List, Dict, Tuple, Optional
+import threading
+import weakref
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Dict, Tuple, Optional
 import time
 
+try:
+    from algorithms_numba import (RADIX_BUCKETS, dijkstra_csr, dijkstra_one_to_all_csr,
+                                  dijkstra_radix_csr, dijkstra_one_to_all_radix_csr,
+                                  a_star_csr, bidirectional_csr)
+except ImportError:
+    # Numba is optional; the searches fall back to the pure Python loops
+    dijkstra_csr = None
+    dijkstra_one_to_all_csr = None
+    dijkstra_radix_csr = None
+    dijkstra_one_to_all_radix_csr = None
+    a_star_csr = None
+    bidirectional_csr = None
+
+# Earth radius in kilometers
+EARTH_RADIUS_KM = 6371.0
+
+# GraphGenerator rounds edge weights to at most three decimals, so scaled by this
+# factor (meters, thousandths of a minute) they are exact integers
+WEIGHT_SCALE = 1000
+
+# Per-island GA settings for the island model: (mutation rate multiplier, tournament size).
+# Islands cycle through these so sub-populations explore with different pressure.
+ISLAND_SETTINGS = [(1.0, 3), (0.5, 2), (1.5, 4), (2.0, 3)]
+
+
+def _build_csr(adjacency: List[List[Tuple[int, float, float]]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Pack per-node (neighbor, distance, time) lists into (indptr, indices, w_distance, w_time)"""
+    indptr = np.zeros(len(adjacency) + 1, dtype=np.int32)
+    indptr[1:] = np.cumsum([len(edges) for edges in adjacency])
+    indices = np.array([edge[0] for edges in adjacency for edge in edges], dtype=np.int32)
+    w_distance = np.array([edge[1] for edges in adjacency for edge in edges], dtype=np.float64)
+    w_time = np.array([edge[2] for edges in adjacency for edge in edges], dtype=np.float64)
+    return indptr, indices, w_distance, w_time
+
+
+def _zero_weight_groups(n: int, tails: np.ndarray, heads: np.ndarray, w: np.ndarray) -> np.ndarray:
+    """Label nodes joined by zero-weight edges (in either direction) with a common root"""
+    parent = list(range(n))
+    
+    def find(node: int) -> int:
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+    
+    for edge in np.flatnonzero(w == 0).tolist():
+        root_u = find(int(tails[edge]))
+        root_v = find(int(heads[edge]))
+        if root_u != root_v:
+            parent[root_u] = root_v
+    
+    return np.array([find(node) for node in range(n)], dtype=np.int64)
+
+
 class RouteOptimizer:
     """Main class for route optimization algorithms"""
     
@@ -15,11 +76,78 @@ class RouteOptimizer:
         self.graph = graph
         self.nodes = list(graph.keys())
         
-    def heuristic(self, node1: str, node2: str, positions: Dict[str, Tuple[float, float]]) -> float:
-        """Calculate Euclidean distance heuristic for A*"""
-        x1, y1 = positions[node1]
-        x2, y2 = positions[node2]
-        return math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
+        # Searches run on integer node IDs; strings are only used at the API boundary
+        self.id_of = {node: i for i, node in enumerate(self.nodes)}
+        
+        # Nodes that only appear as edge targets still need an integer ID
+        for neighbors in graph.values():
+            for neighbor in neighbors:
+                if neighbor not in self.id_of:
+                    self.id_of[neighbor] = len(self.nodes)
+                    self.nodes.append(neighbor)
+        
+        # Node IDs never change after construction
+        self.nodes = tuple(self.nodes)
+        
+        # Forward and reversed adjacency as lists of (neighbor, distance, time);
+        # graph edges are directed, so the reversed one is built here once for the
+        # backward half of bidirectional search
+        adj = [[] for _ in self.nodes]
+        reverse_adj = [[] for _ in self.nodes]
+        for node, neighbors in graph.items():
+            u = self.id_of[node]
+            for neighbor, edge_data in neighbors.items():
+                v = self.id_of[neighbor]
+                distance = edge_data.get('distance', float('inf'))
+                travel_time = edge_data.get('time', float('inf'))
+                adj[u].append((v, distance, travel_time))
+                reverse_adj[v].append((u, distance, travel_time))
+        
+        # Compressed sparse row (CSR) form of adj: the out-edges of node u are
+        # indices[indptr[u]:indptr[u + 1]], with their weights at the same positions.
+        # The _r arrays hold the in-edges of the reversed graph the same way.
+        self.indptr, self.indices, self.w_distance, self.w_time = _build_csr(adj)
+        self.indptr_r, self.indices_r, self.w_distance_r, self.w_time_r = _build_csr(reverse_adj)
+        
+        # Indexing numpy scalars one at a time is slower than indexing lists,
+        # so the pure Python loops read list copies of the CSR arrays
+        self._indptr = self.indptr.tolist()
+        self._indices = self.indices.tolist()
+        self._weights = {'distance': self.w_distance.tolist(), 'time': self.w_time.tolist()}
+        self._indptr_r = self.indptr_r.tolist()
+        self._indices_r = self.indices_r.tolist()
+        self._weights_r = {'distance': self.w_distance_r.tolist(), 'time': self.w_time_r.tolist()}
+        self._weight_arrays = {'distance': self.w_distance, 'time': self.w_time}
+        self._weight_arrays_r = {'distance': self.w_distance_r, 'time': self.w_time_r}
+        
+        # Integer copies of the weights for the radix heap kernels, kept only for
+        # metrics whose weights are non-negative exact multiples of 1 / WEIGHT_SCALE.
+        # The radix heap cannot order negative keys.
+        self._quantized_weights = {}
+        for metric, w in self._weight_arrays.items():
+            scaled = w * WEIGHT_SCALE
+            if np.isfinite(scaled).all():
+                rounded = np.rint(scaled)
+                if rounded.min(initial=0.0) >= 0 and np.abs(scaled - rounded).max(initial=0.0) < 1e-6:
+                    self._quantized_weights[metric] = rounded.astype(np.int64)
+        
+        # Per-metric node positions in radians and heuristic scales, built on first use by A*
+        self._position_cache = None
+        
+        # Work arrays for the compiled kernels, allocated once per thread (Flask
+        # serves requests on several threads) and reset by the kernels on each call
+        self._scratch = threading.local()
+        
+        # Worker pool for the island model, created on first use
+        self._island_lock = threading.Lock()
+        self._island_pool = None
+        self._island_finalizer = None
+        
+    def heuristic(self, node1: str, node2: str, positions: Dict[str, Tuple[float, float]],
+                  metric: str = 'distance') -> float:
+        """A*'s lower bound on the metric cost of travelling from node1 to node2"""
+        self._metric_weights(metric)
+        return self._heuristic_to(self.id_of[node2], positions, metric)(self.id_of[node1])
     
     def dijkstra(self, start: str, end: str, metric: str = 'distance') -> Tuple[List[str], float, Dict]:
         """
@@ -35,40 +163,78 @@ class RouteOptimizer:
         """
         start_time = time.time()
         
-        # Priority queue: (cost, node, path)
-        pq = [(0, start, [start])]
-        visited = set()
-        costs = {start: 0}
+        w = self._metric_weights(metric)
+        indptr = self._indptr
+        indices = self._indices
+        source = self.id_of.get(start)
+        target = self.id_of.get(end)
+        
+        if dijkstra_csr is not None and source is not None and target is not None:
+            quantized = self._quantized_weights.get(metric)
+            if quantized is not None:
+                parents, cost, nodes_explored = dijkstra_radix_csr(
+                    self.indptr, self.indices, quantized, source, target, self._radix_scratch()
+                )
+                cost = cost / WEIGHT_SCALE if cost >= 0 else float('inf')
+            else:
+                parents, cost, nodes_explored = dijkstra_csr(
+                    self.indptr, self.indices, self._weight_arrays[metric], source, target, self._heap_scratch()
+                )
+            execution_time = time.time() - start_time
+            if cost < float('inf'):
+                return self._reconstruct_path(parents, target), float(cost), {
+                    'nodes_explored': nodes_explored,
+                    'execution_time': execution_time,
+                    'algorithm': 'Dijkstra'
+                }
+            return [], float('inf'), {
+                'nodes_explored': nodes_explored,
+                'execution_time': execution_time,
+                'algorithm': 'Dijkstra',
+                'error': 'No path found'
+            }
+        
+        # Priority queue: (cost, node); paths are rebuilt from parent pointers
+        pq = [(0, source)] if source is not None and target is not None else []
+        settled = bytearray(len(self.nodes))
+        costs = [float('inf')] * len(self.nodes)
+        parents = [-1] * len(self.nodes)
+        if pq:
+            costs[source] = 0
         nodes_explored = 0
         
+        # Bound once; the loop below calls these for every edge relaxation
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        
         while pq:
-            current_cost, current_node, path = heapq.heappop(pq)
+            current_cost, current_node = heappop(pq)
             
-            if current_node in visited:
+            if settled[current_node]:
                 continue
                 
-            visited.add(current_node)
+            settled[current_node] = 1
             nodes_explored += 1
             
-            if current_node == end:
+            if current_node == target:
                 execution_time = time.time() - start_time
-                return path, current_cost, {
+                return self._reconstruct_path(parents, target), current_cost, {
                     'nodes_explored': nodes_explored,
                     'execution_time': execution_time,
                     'algorithm': 'Dijkstra'
                 }
             
-            if current_node not in self.graph:
-                continue
+            for k in range(indptr[current_node], indptr[current_node + 1]):
+                neighbor = indices[k]
+                if settled[neighbor]:
+                    continue
                 
-            for neighbor, edge_data in self.graph[current_node].items():
-                if neighbor not in visited:
-                    cost = edge_data.get(metric, float('inf'))
-                    new_cost = current_cost + cost
-                    
-                    if neighbor not in costs or new_cost < costs[neighbor]:
-                        costs[neighbor] = new_cost
-                        heapq.heappush(pq, (new_cost, neighbor, path + [neighbor]))
+                new_cost = current_cost + w[k]
+                
+                if new_cost < costs[neighbor]:
+                    costs[neighbor] = new_cost
+                    parents[neighbor] = current_node
+                    heappush(pq, (new_cost, neighbor))
         
         execution_time = time.time() - start_time
         return [], float('inf'), {
@@ -78,6 +244,126 @@ class RouteOptimizer:
             'error': 'No path found'
         }
     
+    def _dijkstra_one_to_all(self, source: int, metric: str) -> Tuple[List[float], List[int]]:
+        """
+        Dijkstra from source to every node, without stopping at a destination
+        
+        Returns:
+            Tuple of (costs, parents) indexed by integer node ID
+        """
+        w = self._metric_weights(metric)
+        
+        if dijkstra_one_to_all_csr is not None:
+            quantized = self._quantized_weights.get(metric)
+            if quantized is not None:
+                costs, parents = dijkstra_one_to_all_radix_csr(
+                    self.indptr, self.indices, quantized, source, self._radix_scratch()
+                )
+                costs = np.where(costs >= 0, costs / WEIGHT_SCALE, np.inf)
+            else:
+                costs, parents = dijkstra_one_to_all_csr(
+                    self.indptr, self.indices, self._weight_arrays[metric], source, self._heap_scratch()
+                )
+            return costs.tolist(), parents.tolist()
+        
+        indptr = self._indptr
+        indices = self._indices
+        pq = [(0, source)]
+        settled = bytearray(len(self.nodes))
+        costs = [float('inf')] * len(self.nodes)
+        parents = [-1] * len(self.nodes)
+        costs[source] = 0
+        
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        
+        while pq:
+            current_cost, current_node = heappop(pq)
+            
+            if settled[current_node]:
+                continue
+            settled[current_node] = 1
+            
+            for k in range(indptr[current_node], indptr[current_node + 1]):
+                neighbor = indices[k]
+                if settled[neighbor]:
+                    continue
+                
+                new_cost = current_cost + w[k]
+                
+                if new_cost < costs[neighbor]:
+                    costs[neighbor] = new_cost
+                    parents[neighbor] = current_node
+                    heappush(pq, (new_cost, neighbor))
+        
+        return costs, parents
+    
+    def _heap_scratch(self) -> Tuple[np.ndarray, ...]:
+        """This thread's work arrays for the binary heap kernels"""
+        scratch = getattr(self._scratch, 'heap', None)
+        if scratch is None:
+            n = len(self.nodes)
+            capacity = len(self.indices) + 1
+            scratch = self._scratch.heap = (
+                np.full(n, -1, dtype=np.int32),       # parents
+                np.full(n, np.inf),                   # costs
+                np.zeros(n, dtype=np.uint8),          # settled
+                np.empty(capacity, dtype=np.float64), # heap keys
+                np.empty(capacity, dtype=np.int32)    # heap nodes
+            )
+        return scratch
+    
+    def _radix_scratch(self) -> Tuple[np.ndarray, ...]:
+        """This thread's work arrays for the radix heap kernels"""
+        scratch = getattr(self._scratch, 'radix', None)
+        if scratch is None:
+            n = len(self.nodes)
+            capacity = len(self.indices) + 1
+            scratch = self._scratch.radix = (
+                np.full(n, -1, dtype=np.int32),          # parents
+                np.zeros(n, dtype=np.int64),             # costs
+                np.zeros(n, dtype=np.uint8),             # settled
+                np.empty(capacity, dtype=np.int64),      # entry keys
+                np.empty(capacity, dtype=np.int32),      # entry nodes
+                np.empty(capacity, dtype=np.int32),      # entry links
+                np.full(RADIX_BUCKETS, -1, dtype=np.int32)  # bucket heads
+            )
+        return scratch
+    
+    def _a_star_scratch(self) -> Tuple[np.ndarray, ...]:
+        """This thread's work arrays for the A* kernel"""
+        scratch = getattr(self._scratch, 'a_star', None)
+        if scratch is None:
+            n = len(self.nodes)
+            capacity = len(self.indices) + 1
+            scratch = self._scratch.a_star = (
+                np.full(n, -1, dtype=np.int32),       # parents
+                np.full(n, np.inf),                   # g scores
+                np.zeros(n, dtype=np.uint8),          # settled
+                np.empty(capacity, dtype=np.float64), # heap f scores
+                np.empty(capacity, dtype=np.float64), # heap -g scores
+                np.empty(capacity, dtype=np.int64),   # heap insertion order
+                np.empty(capacity, dtype=np.int32)    # heap nodes
+            )
+        return scratch
+    
+    def _bidirectional_scratch(self) -> Tuple[np.ndarray, ...]:
+        """This thread's work arrays for the bidirectional kernel, one row per direction"""
+        scratch = getattr(self._scratch, 'bidirectional', None)
+        if scratch is None:
+            n = len(self.nodes)
+            capacity = len(self.indices) + 1
+            scratch = self._scratch.bidirectional = (
+                np.full((2, n), -1, dtype=np.int32),       # parents
+                np.full((2, n), np.inf),                   # costs
+                np.zeros((2, n), dtype=np.uint8),          # settled
+                np.empty((2, capacity), dtype=np.float64), # heap keys
+                np.empty((2, capacity), dtype=np.float64), # heap tiebreaks
+                np.empty((2, capacity), dtype=np.int64),   # heap sequence (the node)
+                np.empty((2, capacity), dtype=np.int32)    # heap nodes
+            )
+        return scratch
+    
     def a_star(self, start: str, end: str, positions: Dict[str, Tuple[float, float]], 
                metric: str = 'distance') -> Tuple[List[str], float, Dict]:
         """
@@ -94,42 +380,80 @@ class RouteOptimizer:
         """
         start_time = time.time()
         
-        # Priority queue: (f_score, g_score, node, path)
-        pq = [(0, 0, start, [start])]
-        visited = set()
-        g_scores = {start: 0}
+        w = self._metric_weights(metric)
+        indptr = self._indptr
+        indices = self._indices
+        source = self.id_of.get(start)
+        target = self.id_of.get(end)
+        
+        if a_star_csr is not None and source is not None and target is not None:
+            _, _, scale, lat, lon = self._position_arrays(positions)[metric]
+            parents, cost, nodes_explored = a_star_csr(
+                self.indptr, self.indices, self._weight_arrays[metric], lat, lon,
+                scale * EARTH_RADIUS_KM, source, target, self._a_star_scratch()
+            )
+            execution_time = time.time() - start_time
+            if cost < float('inf'):
+                return self._reconstruct_path(parents, target), float(cost), {
+                    'nodes_explored': nodes_explored,
+                    'execution_time': execution_time,
+                    'algorithm': 'A*'
+                }
+            return [], float('inf'), {
+                'nodes_explored': nodes_explored,
+                'execution_time': execution_time,
+                'algorithm': 'A*',
+                'error': 'No path found'
+            }
+        
+        # Priority queue: (f_score, -g_score, counter, node). Ties on f go to the larger g,
+        # i.e. the node closer to the goal, then to insertion order.
+        # Paths are rebuilt from parent pointers.
+        counter = itertools.count()
+        pq = [(0, 0, next(counter), source)] if source is not None and target is not None else []
+        if pq:
+            heuristic = self._heuristic_to(target, positions, metric)
+        settled = bytearray(len(self.nodes))
+        g_scores = [float('inf')] * len(self.nodes)
+        parents = [-1] * len(self.nodes)
+        if pq:
+            g_scores[source] = 0
         nodes_explored = 0
         
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        next_count = counter.__next__
+        
         while pq:
-            f_score, g_score, current_node, path = heapq.heappop(pq)
+            f_score, neg_g, _, current_node = heappop(pq)
+            g_score = -neg_g
             
-            if current_node in visited:
+            if settled[current_node]:
                 continue
                 
-            visited.add(current_node)
+            settled[current_node] = 1
             nodes_explored += 1
             
-            if current_node == end:
+            if current_node == target:
                 execution_time = time.time() - start_time
-                return path, g_score, {
+                return self._reconstruct_path(parents, target), g_score, {
                     'nodes_explored': nodes_explored,
                     'execution_time': execution_time,
                     'algorithm': 'A*'
                 }
             
-            if current_node not in self.graph:
-                continue
+            for k in range(indptr[current_node], indptr[current_node + 1]):
+                neighbor = indices[k]
+                if settled[neighbor]:
+                    continue
                 
-            for neighbor, edge_data in self.graph[current_node].items():
-                if neighbor not in visited:
-                    cost = edge_data.get(metric, float('inf'))
-                    tentative_g = g_score + cost
-                    
-                    if neighbor not in g_scores or tentative_g < g_scores[neighbor]:
-                        g_scores[neighbor] = tentative_g
-                        h_score = self.heuristic(neighbor, end, positions)
-                        f_score = tentative_g + h_score
-                        heapq.heappush(pq, (f_score, tentative_g, neighbor, path + [neighbor]))
+                tentative_g = g_score + w[k]
+                
+                if tentative_g < g_scores[neighbor]:
+                    g_scores[neighbor] = tentative_g
+                    parents[neighbor] = current_node
+                    f_score = tentative_g + heuristic(neighbor)
+                    heappush(pq, (f_score, -tentative_g, next_count(), neighbor))
         
         execution_time = time.time() - start_time
         return [], float('inf'), {
@@ -139,9 +463,285 @@ class RouteOptimizer:
             'error': 'No path found'
         }
     
+    def bidirectional_dijkstra(self, start: str, end: str,
+                               metric: str = 'distance') -> Tuple[List[str], float, Dict]:
+        """
+        Bidirectional Dijkstra: searches forward from start and backward from end
+        until the two frontiers meet
+        
+        Args:
+            start: Starting node ID
+            end: Destination node ID
+            metric: 'distance' or 'time' to optimize for
+            
+        Returns:
+            Tuple of (path, cost, stats)
+        """
+        return self._bidirectional_search(start, end, metric, None, 'Bidirectional Dijkstra')
+    
+    def bidirectional_a_star(self, start: str, end: str, positions: Dict[str, Tuple[float, float]],
+                             metric: str = 'distance') -> Tuple[List[str], float, Dict]:
+        """
+        Bidirectional A* using the average of the forward and backward heuristics
+        as a consistent potential for both searches
+        
+        Args:
+            start: Starting node ID
+            end: Destination node ID
+            positions: Dictionary mapping node IDs to (lat, lon) coordinates
+            metric: 'distance' or 'time' to optimize for
+            
+        Returns:
+            Tuple of (path, cost, stats)
+        """
+        return self._bidirectional_search(start, end, metric, positions, 'Bidirectional A*')
+    
+    def _bidirectional_search(self, start: str, end: str, metric: str,
+                              positions: Optional[Dict[str, Tuple[float, float]]],
+                              algorithm: str) -> Tuple[List[str], float, Dict]:
+        """
+        Shared bidirectional search loop. Heap keys are the real cost plus the
+        forward potential (negated for the backward side), the average of the
+        heuristics towards end and from start; without positions this is plain
+        bidirectional Dijkstra.
+        """
+        start_time = time.time()
+        
+        w = self._metric_weights(metric)
+        source = self.id_of.get(start)
+        target = self.id_of.get(end)
+        n = len(self.nodes)
+        
+        if bidirectional_csr is not None and source is not None and target is not None:
+            if positions is not None:
+                _, _, scale, lat, lon = self._position_arrays(positions)[metric]
+                scale *= EARTH_RADIUS_KM
+            else:
+                lat = lon = np.zeros(n)
+                scale = 0.0
+            forward_parents, backward_parents, best_cost, meeting_node, nodes_explored = bidirectional_csr(
+                self.indptr, self.indices, self._weight_arrays[metric],
+                self.indptr_r, self.indices_r, self._weight_arrays_r[metric],
+                lat, lon, scale, source, target, self._bidirectional_scratch()
+            )
+            parents = (forward_parents, backward_parents)
+            best_cost = float(best_cost)
+        else:
+            parents, best_cost, meeting_node, nodes_explored = self._bidirectional_loop(
+                source, target, metric, positions
+            )
+        
+        execution_time = time.time() - start_time
+        
+        if meeting_node == -1:
+            return [], float('inf'), {
+                'nodes_explored': nodes_explored,
+                'execution_time': execution_time,
+                'algorithm': algorithm,
+                'error': 'No path found'
+            }
+        
+        # Splice the forward chain (start -> meeting node) with the backward chain (meeting node -> end)
+        path = self._reconstruct_path(parents[0], meeting_node)
+        node = parents[1][meeting_node]
+        while node != -1:
+            path.append(self.nodes[node])
+            node = parents[1][node]
+        
+        return path, best_cost, {
+            'nodes_explored': nodes_explored,
+            'execution_time': execution_time,
+            'algorithm': algorithm
+        }
+    
+    def _bidirectional_loop(self, source: Optional[int], target: Optional[int], metric: str,
+                            positions: Optional[Dict[str, Tuple[float, float]]]) -> Tuple[Tuple[List[int], List[int]], float, int, int]:
+        """
+        Pure Python bidirectional search
+        
+        Returns:
+            Tuple of ((forward parents, backward parents), cost, meeting node, nodes_explored)
+        """
+        if positions is not None and source is not None and target is not None:
+            to_end = self._heuristic_to(target, positions, metric)
+            from_start = self._heuristic_to(source, positions, metric)
+            potentials = {}
+            
+            def potential(node: int) -> float:
+                if node not in potentials:
+                    potentials[node] = (to_end(node) - from_start(node)) / 2
+                return potentials[node]
+        else:
+            potential = lambda node: 0
+        
+        w = self._metric_weights(metric)
+        n = len(self.nodes)
+        
+        # Index 0 is the forward search over the CSR arrays, 1 the backward search
+        # over their reversed copies
+        indptrs = (self._indptr, self._indptr_r)
+        indices = (self._indices, self._indices_r)
+        weights = (w, self._weights_r[metric])
+        signs = (1, -1)
+        if source is not None and target is not None:
+            pqs = ([(potential(source), source)], [(-potential(target), target)])
+        else:
+            pqs = ([], [])
+        costs = ([float('inf')] * n, [float('inf')] * n)
+        parents = ([-1] * n, [-1] * n)
+        settled = (bytearray(n), bytearray(n))
+        if pqs[0]:
+            costs[0][source] = 0
+            costs[1][target] = 0
+        nodes_explored = 0
+        
+        # Best meeting cost found so far
+        best_cost = 0 if pqs[0] and source == target else float('inf')
+        meeting_node = source if best_cost == 0 else -1
+        
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        
+        while pqs[0] and pqs[1]:
+            if pqs[0][0][0] + pqs[1][0][0] >= best_cost:
+                break
+            
+            # Expand the side with the smaller top key, the smaller frontier on ties
+            if pqs[0][0][0] != pqs[1][0][0]:
+                side = 0 if pqs[0][0][0] < pqs[1][0][0] else 1
+            else:
+                side = 0 if len(pqs[0]) <= len(pqs[1]) else 1
+            
+            pq = pqs[side]
+            side_costs = costs[side]
+            other_costs = costs[1 - side]
+            side_settled = settled[side]
+            sign = signs[side]
+            side_indptr = indptrs[side]
+            side_indices = indices[side]
+            side_w = weights[side]
+            
+            _, current_node = heappop(pq)
+            
+            if side_settled[current_node]:
+                continue
+            
+            side_settled[current_node] = 1
+            nodes_explored += 1
+            current_cost = side_costs[current_node]
+            
+            for k in range(side_indptr[current_node], side_indptr[current_node + 1]):
+                neighbor = side_indices[k]
+                if side_settled[neighbor]:
+                    continue
+                
+                new_cost = current_cost + side_w[k]
+                
+                if new_cost < side_costs[neighbor]:
+                    side_costs[neighbor] = new_cost
+                    parents[side][neighbor] = current_node
+                    heappush(pq, (new_cost + sign * potential(neighbor), neighbor))
+                
+                total_cost = side_costs[neighbor] + other_costs[neighbor]
+                if total_cost < best_cost:
+                    best_cost = total_cost
+                    meeting_node = neighbor
+        
+        return parents, best_cost, meeting_node, nodes_explored
+    
+    def _heuristic_to(self, target: int, positions: Dict[str, Tuple[float, float]],
+                      metric: str) -> Callable[[int], float]:
+        """
+        Build a cached consistent heuristic towards target. Uses an equirectangular
+        projection around the target, so only cos(lat) of the target is needed and
+        each estimate is one multiply and one sqrt, scaled into metric units.
+        """
+        lat, lon, scale, _, _ = self._position_arrays(positions)[metric]
+        scale *= EARTH_RADIUS_KM
+        target_lat = lat[target]
+        target_lon = lon[target]
+        k = math.cos(target_lat)
+        h_cache = {}
+        
+        def heuristic(node: int) -> float:
+            h_score = h_cache.get(node)
+            if h_score is None:
+                dy = lat[node] - target_lat
+                dx = (lon[node] - target_lon) * k
+                h_score = h_cache[node] = scale * math.sqrt(dx * dx + dy * dy)
+            return h_score
+        
+        return heuristic
+    
+    def _position_arrays(self, positions: Dict[str, Tuple[float, float]]) -> Dict[str, Tuple]:
+        """
+        Return, per metric, node latitudes and longitudes in radians indexed by
+        integer ID plus the factor that keeps the heuristic consistent, as
+        (lat list, lon list, scale, lat array, lon array). The lists serve the pure
+        Python loops and the arrays the compiled kernels. Cached for as long as the
+        same positions dict is passed in.
+        """
+        cache = self._position_cache
+        if cache is not None and cache[0] is positions:
+            return cache[1]
+        
+        n = len(self.nodes)
+        node_lat = np.radians(np.array([positions[node][0] for node in self.nodes], dtype=np.float64))
+        node_lon = np.radians(np.array([positions[node][1] for node in self.nodes], dtype=np.float64))
+        tails = np.repeat(np.arange(n), np.diff(self.indptr))
+        
+        heuristics = {}
+        for metric, w in self._weight_arrays.items():
+            # Zero weights come from rounding very short segments. Their endpoints are
+            # merged and share the mean position of their group, so the heuristic is
+            # equal across every zero-weight edge instead of forcing the scale to zero.
+            groups = _zero_weight_groups(n, tails, self.indices, w)
+            counts = np.bincount(groups, minlength=n)
+            present = counts > 0
+            pos_lat = np.zeros(n)
+            pos_lon = np.zeros(n)
+            pos_lat[present] = (np.bincount(groups, weights=node_lat, minlength=n)[present] / counts[present])
+            pos_lon[present] = (np.bincount(groups, weights=node_lon, minlength=n)[present] / counts[present])
+            pos_lat = pos_lat[groups]
+            pos_lon = pos_lon[groups]
+            
+            # Straight-line length of every edge, projected with the largest cos(lat) in the
+            # graph so it never falls short of what any query-time projection would give
+            k = np.cos(pos_lat).max() if n else 1.0
+            dy = pos_lat[self.indices] - pos_lat[tails]
+            dx = (pos_lon[self.indices] - pos_lon[tails]) * k
+            straight = EARTH_RADIUS_KM * np.sqrt(dx * dx + dy * dy)
+            
+            # The cheapest cost per straight-line kilometer over all edges bounds every
+            # path, e.g. minutes per km at the highest speed for the 'time' metric.
+            # Edges inside a merged group have no length and impose no bound.
+            measurable = straight > 0
+            scale = float((w[measurable] / straight[measurable]).min()) if measurable.any() else 0.0
+            heuristics[metric] = (pos_lat.tolist(), pos_lon.tolist(), max(scale, 0.0), pos_lat, pos_lon)
+        
+        self._position_cache = (positions, heuristics)
+        return heuristics
+    
+    def _metric_weights(self, metric: str) -> List[float]:
+        """Resolve a metric name to its CSR edge weights"""
+        if metric not in self._weights:
+            raise ValueError(f"Unknown metric '{metric}', expected one of {list(self._weights)}")
+        return self._weights[metric]
+    
+    def _reconstruct_path(self, parents: List[int], end: int) -> List[str]:
+        """Walk parent pointers back from end to rebuild the path as node IDs"""
+        path = []
+        node = end
+        while node != -1:
+            path.append(self.nodes[node])
+            node = parents[node]
+        path.reverse()
+        return path
+    
     def genetic_algorithm(self, start: str, end: str, intermediate_points: List[str],
                          metric: str = 'distance', population_size: int = 50, 
-                         generations: int = 100, mutation_rate: float = 0.2) -> Tuple[List[str], float, Dict]:
+                         generations: int = 100, mutation_rate: float = 0.2, islands: int = 1,
+                         migration_interval: int = 10, migration_size: int = 2) -> Tuple[List[str], float, Dict]:
         """
         Genetic Algorithm for route optimization with waypoints
         
@@ -150,9 +750,16 @@ class RouteOptimizer:
             end: Destination node ID
             intermediate_points: List of waypoints to visit
             metric: 'distance' or 'time' to optimize for
-            population_size: Number of chromosomes in population
+            population_size: Number of chromosomes in population, split evenly across
+                             islands; stats report the total actually evolved
             generations: Number of generations to evolve
             mutation_rate: Probability of mutation
+            islands: Number of sub-populations evolved in parallel worker processes
+                     (1 runs a single population in-process). Workers are started
+                     without fork, so scripts using islands > 1 need the usual
+                     `if __name__ == '__main__':` guard.
+            migration_interval: Generations between migrations in the island model
+            migration_size: Chromosomes each island sends to the next on migration
             
         Returns:
             Tuple of (path, cost, stats)
@@ -163,100 +770,264 @@ class RouteOptimizer:
             # If no intermediate points, just use Dijkstra
             return self.dijkstra(start, end, metric)
         
-        # Create initial population of random orderings
+        unknown = [node for node in [start, end] + intermediate_points if node not in self.id_of]
+        if unknown:
+            return [], float('inf'), {
+                'algorithm': 'Genetic Algorithm',
+                'execution_time': time.time() - start_time,
+                'error': f"Unknown nodes: {', '.join(unknown)}"
+            }
+        
+        # Solve every pairwise shortest path between the stops once, turning the GA
+        # into a TSP over a small matrix. Stop 0 is start, the last stop is end, and
+        # chromosomes are orderings of the waypoint stops 1..m-2.
+        stops = [self.id_of[node] for node in [start] + intermediate_points + [end]]
+        distances = []
+        stop_parents = []
+        for stop in stops:
+            costs, parents = self._dijkstra_one_to_all(stop, metric)
+            distances.append([costs[other] for other in stops])
+            stop_parents.append(parents)
+        waypoints = list(range(1, len(stops) - 1))
+        
+        if islands > 1:
+            best_chromosome, best_fitness, generation_stats, evolved_size = self._island_model(
+                distances, waypoints, population_size, generations,
+                mutation_rate, islands, migration_interval, migration_size
+            )
+        else:
+            evolved_size = population_size
+            population = self._random_population(waypoints, population_size)
+            _, best_chromosome, best_fitness, generation_stats, _ = self._evolve(
+                population, distances, generations, mutation_rate
+            )
+        
+        if best_chromosome is None or best_fitness == float('inf'):
+            # Every ordering was unreachable
+            return [], float('inf'), {
+                'algorithm': 'Genetic Algorithm',
+                'execution_time': time.time() - start_time,
+                'error': 'No path found'
+            }
+        
+        # Build final path by splicing the precomputed segments along the best ordering
+        full_route = [0] + best_chromosome + [len(stops) - 1]
+        detailed_path = self._reconstruct_path(stop_parents[0], stops[0])
+        total_cost = 0
+        
+        for i in range(len(full_route) - 1):
+            origin, destination = full_route[i], full_route[i+1]
+            segment_path = self._reconstruct_path(stop_parents[origin], stops[destination])
+            detailed_path.extend(segment_path[1:])  # Avoid duplicating nodes
+            total_cost += distances[origin][destination]
+        
+        execution_time = time.time() - start_time
+        
+        return detailed_path, total_cost, {
+            'algorithm': 'Genetic Algorithm',
+            'execution_time': execution_time,
+            'generations': generations,
+            'population_size': evolved_size,
+            'islands': islands,
+            'best_fitness': best_fitness,
+            'generation_stats': generation_stats[:10]  # Return first 10 for visualization
+        }
+    
+    def _random_population(self, waypoints: List[int], size: int) -> List[List[int]]:
+        """Create a population of random waypoint orderings"""
         population = []
-        for _ in range(population_size):
-            chromosome = intermediate_points.copy()
+        for _ in range(size):
+            chromosome = waypoints.copy()
             random.shuffle(chromosome)
             population.append(chromosome)
+        return population
+    
+    def _evolve(self, population: List[List[int]], distances: List[List[float]],
+                generations: int, mutation_rate: float, tournament_size: int = 3,
+                num_migrants: int = 0) -> Tuple[List[List[int]], Optional[List[int]], float, List[Dict], List[List[int]]]:
+        """
+        Evolve a population for a number of generations
+        
+        Returns:
+            Tuple of (population, best_chromosome, best_fitness, generation_stats, migrants),
+            where migrants are the num_migrants fittest chromosomes of the last generation
+        """
+        # Seeded from the stdlib RNG so random.seed() still makes runs reproducible
+        rng = np.random.default_rng(random.getrandbits(64))
         
         best_fitness = float('inf')
         best_chromosome = None
         generation_stats = []
+        migrants = []
+        last_stop = len(distances) - 1
+        size = len(population)
+        upper_bound = float('inf')
         
         for gen in range(generations):
-            # Evaluate fitness for each chromosome
-            fitness_scores = []
-            for chromosome in population:
-                fitness = self._evaluate_route_fitness([start] + chromosome + [end], metric)
-                fitness_scores.append(fitness)
-                
-                if fitness < best_fitness:
-                    best_fitness = fitness
-                    best_chromosome = chromosome.copy()
+            # Evaluate fitness for each chromosome. Routes costlier than every member
+            # of the previous generation are cut short and scored inf, which only
+            # matters in tournaments where every contestant was cut.
+            fitness_scores = np.array([
+                self._evaluate_route_fitness([0] + chromosome + [last_stop], distances, upper_bound)
+                for chromosome in population
+            ])
+            finite_scores = fitness_scores[np.isfinite(fitness_scores)]
+            if len(finite_scores):
+                upper_bound = float(finite_scores.max())
+            
+            fittest = int(fitness_scores.argmin())
+            if fitness_scores[fittest] < best_fitness:
+                best_fitness = float(fitness_scores[fittest])
+                best_chromosome = population[fittest].copy()
             
             generation_stats.append({
                 'generation': gen,
                 'best_fitness': best_fitness,
-                'avg_fitness': sum(fitness_scores) / len(fitness_scores)
+                'avg_fitness': float(finite_scores.mean()) if len(finite_scores) else float('inf')
             })
             
-            # Selection (Tournament selection)
+            if num_migrants and gen == generations - 1:
+                ranked = np.argsort(fitness_scores, kind='stable')[:num_migrants]
+                migrants = [population[i].copy() for i in ranked]
+            
+            # Selection (Tournament selection), both parents of every child in one call
+            winners = self._tournament_selection(fitness_scores, 2 * size, tournament_size, rng)
+            mutations = rng.random(size) < mutation_rate
+            
             new_population = []
-            for _ in range(population_size):
-                parent1 = self._tournament_selection(population, fitness_scores)
-                parent2 = self._tournament_selection(population, fitness_scores)
+            for i in range(size):
+                parent1 = population[winners[2 * i]]
+                parent2 = population[winners[2 * i + 1]]
                 
                 # Crossover
                 child = self._ordered_crossover(parent1, parent2)
                 
                 # Mutation
-                if random.random() < mutation_rate:
+                if mutations[i]:
                     child = self._swap_mutation(child)
                 
                 new_population.append(child)
             
             population = new_population
         
-        # Build final path using best chromosome
-        full_route = [start] + best_chromosome + [end]
-        detailed_path = []
-        total_cost = 0
+        return population, best_chromosome, best_fitness, generation_stats, migrants
+    
+    def _island_model(self, distances: List[List[float]], waypoints: List[int],
+                      population_size: int, generations: int, mutation_rate: float, islands: int,
+                      migration_interval: int, migration_size: int) -> Tuple[Optional[List[int]], float, List[Dict], int]:
+        """
+        Evolve independent sub-populations in worker processes, each with its own
+        mutation rate and tournament size from ISLAND_SETTINGS. Every
+        migration_interval generations each island's best chromosomes replace part
+        of the next island's population (ring topology).
         
-        for i in range(len(full_route) - 1):
-            segment_path, segment_cost, _ = self.dijkstra(full_route[i], full_route[i+1], metric)
-            if segment_path:
-                if detailed_path:
-                    detailed_path.extend(segment_path[1:])  # Avoid duplicating nodes
-                else:
-                    detailed_path.extend(segment_path)
-                total_cost += segment_cost
-            else:
-                total_cost = float('inf')
-                break
+        Returns:
+            Tuple of (best_chromosome, best_fitness, generation_stats, population size),
+            where the population size is the total over all islands
+        """
+        pool = self._get_island_pool()
         
-        execution_time = time.time() - start_time
+        settings = []
+        for i in range(islands):
+            rate_factor, tournament_size = ISLAND_SETTINGS[i % len(ISLAND_SETTINGS)]
+            settings.append((min(1.0, mutation_rate * rate_factor), tournament_size))
+        island_size = max(population_size // islands, max(size for _, size in settings))
+        populations = [self._random_population(waypoints, island_size) for _ in range(islands)]
         
-        return detailed_path, total_cost, {
-            'algorithm': 'Genetic Algorithm',
-            'execution_time': execution_time,
-            'generations': generations,
-            'population_size': population_size,
-            'best_fitness': best_fitness,
-            'generation_stats': generation_stats[:10]  # Return first 10 for visualization
-        }
+        best_fitness = float('inf')
+        best_chromosome = None
+        generation_stats = []
+        completed = 0
+        
+        while completed < generations:
+            epoch = min(migration_interval, generations - completed)
+            
+            # Each island gets its own seed; forked workers would otherwise share RNG state
+            futures = [
+                pool.submit(_evolve_island, random.randrange(2**32), populations[i], distances,
+                            epoch, rate, tournament_size, migration_size)
+                for i, (rate, tournament_size) in enumerate(settings)
+            ]
+            results = [future.result() for future in futures]
+            
+            running_best = best_fitness
+            for gen in range(epoch):
+                island_stats = [result[3][gen] for result in results]
+                running_best = min([running_best] + [stats['best_fitness'] for stats in island_stats])
+                generation_stats.append({
+                    'generation': completed + gen,
+                    'best_fitness': running_best,
+                    'avg_fitness': sum(stats['avg_fitness'] for stats in island_stats) / islands
+                })
+            
+            for i, (population, chromosome, fitness, _, _) in enumerate(results):
+                populations[i] = population
+                if fitness < best_fitness:
+                    best_fitness = fitness
+                    best_chromosome = chromosome
+            
+            # Migration: island i receives the best chromosomes of island i - 1
+            for i in range(islands):
+                incoming = results[i - 1][4]
+                populations[i][len(populations[i]) - len(incoming):] = incoming
+            
+            completed += epoch
+        
+        return best_chromosome, best_fitness, generation_stats, island_size * islands
+    
+    def _get_island_pool(self) -> ProcessPoolExecutor:
+        """
+        Start the island worker pool on first use. It is sized by CPU count rather
+        than by the first call's islands, so every later call can use up to one
+        worker per core; workers are only started as tasks need them.
+        """
+        with self._island_lock:
+            if self._island_pool is None:
+                # The pool is created from multithreaded servers, where forking can copy a
+                # lock held by another thread into the child; workers only need this module
+                method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+                self._island_pool = ProcessPoolExecutor(
+                    max_workers=os.cpu_count() or 1, initializer=_init_island_worker,
+                    mp_context=multiprocessing.get_context(method)
+                )
+                self._island_finalizer = weakref.finalize(self, self._island_pool.shutdown)
+            return self._island_pool
+    
+    def close(self):
+        """Shut down the island worker pool"""
+        with self._island_lock:
+            if self._island_finalizer is not None:
+                self._island_finalizer()
+            self._island_pool = None
+            self._island_finalizer = None
     
-    def _evaluate_route_fitness(self, route: List[str], metric: str) -> float:
-        """Calculate total cost of a route"""
+    def _evaluate_route_fitness(self, route: List[int], distances: List[List[float]],
+                                upper_bound: float = float('inf')) -> float:
+        """
+        Calculate total cost of a route of stop indices from the pairwise cost matrix.
+        Returns inf as soon as the running total exceeds upper_bound.
+        """
         total_cost = 0
         for i in range(len(route) - 1):
-            if route[i] in self.graph and route[i+1] in self.graph[route[i]]:
-                total_cost += self.graph[route[i]][route[i+1]].get(metric, float('inf'))
-            else:
-                # Use Dijkstra for disconnected segments
-                _, segment_cost, _ = self.dijkstra(route[i], route[i+1], metric)
-                total_cost += segment_cost
+            total_cost += distances[route[i]][route[i+1]]
+            if total_cost > upper_bound:
+                return float('inf')
         return total_cost
     
-    def _tournament_selection(self, population: List[List[str]], 
-                             fitness_scores: List[float], tournament_size: int = 3) -> List[str]:
-        """Tournament selection for genetic algorithm"""
-        tournament_indices = random.sample(range(len(population)), tournament_size)
-        tournament_fitness = [fitness_scores[i] for i in tournament_indices]
-        winner_idx = tournament_indices[tournament_fitness.index(min(tournament_fitness))]
-        return population[winner_idx].copy()
+    def _tournament_selection(self, fitness_scores: np.ndarray, count: int, tournament_size: int,
+                             rng: np.random.Generator) -> List[int]:
+        """
+        Run count tournament selections at once; contestants are drawn with
+        replacement and the one with the lowest fitness wins
+        
+        Returns:
+            Population indices of the winners
+        """
+        contestants = rng.integers(0, len(fitness_scores), size=(count, tournament_size))
+        winners = contestants[np.arange(count), fitness_scores[contestants].argmin(axis=1)]
+        return winners.tolist()
     
-    def _ordered_crossover(self, parent1: List[str], parent2: List[str]) -> List[str]:
+    def _ordered_crossover(self, parent1: List[int], parent2: List[int]) -> List[int]:
         """Ordered crossover for genetic algorithm"""
         size = len(parent1)
         if size < 2:
@@ -267,19 +1038,22 @@ class RouteOptimizer:
         
         # Copy segment from parent1
         child[start:end] = parent1[start:end]
+        in_child = set(child[start:end])
         
-        # Fill remaining from parent2
+        # Fill remaining from parent2, scanning it cyclically from end
         pointer = end
-        for gene in parent2[end:] + parent2[:end]:
-            if gene not in child:
+        for i in range(size):
+            gene = parent2[(end + i) % size]
+            if gene not in in_child:
                 if pointer >= size:
                     pointer = 0
                 child[pointer] = gene
+                in_child.add(gene)
                 pointer += 1
         
         return child
     
-    def _swap_mutation(self, chromosome: List[str]) -> List[str]:
+    def _swap_mutation(self, chromosome: List[int]) -> List[int]:
         """Swap mutation for genetic algorithm"""
         if len(chromosome) < 2:
             return chromosome
@@ -287,4 +1061,21 @@ class RouteOptimizer:
         mutated = chromosome.copy()
         idx1, idx2 = random.sample(range(len(mutated)), 2)
         mutated[idx1], mutated[idx2] = mutated[idx2], mutated[idx1]
-        return mutated
\ No newline at end of file
+        return mutated
+
+
+# Island model workers. Tasks carry the small pairwise cost matrix, so a worker
+# only needs an optimizer for the GA operators, not a copy of the road graph.
+_island_optimizer = None
+
+
+def _init_island_worker():
+    """Build the worker's optimizer"""
+    global _island_optimizer
+    _island_optimizer = RouteOptimizer({})
+
+
+def _evolve_island(seed: int, *args):
+    """Run one migration epoch of an island in a worker process"""
+    random.seed(seed)
+    return _island_optimizer._evolve(*args)
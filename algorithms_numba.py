@@ -0,0 +1,520 @@
+import numpy as np
+from numba import njit
+
+# Compiled shortest path kernels over the CSR arrays built by RouteOptimizer.
+# Importing this module requires numba; algorithms.py falls back to its pure
+# Python loops when it is not installed. The entry points release the GIL, so
+# searches on different threads run in parallel.
+
+
+@njit(cache=True)
+def _heap_push(keys, nodes, size, key, node):
+    """Push (key, node) onto a binary min-heap stored in two parallel arrays"""
+    i = size
+    while i > 0:
+        parent = (i - 1) >> 1
+        if keys[parent] <= key:
+            break
+        keys[i] = keys[parent]
+        nodes[i] = nodes[parent]
+        i = parent
+    keys[i] = key
+    nodes[i] = node
+    return size + 1
+
+
+@njit(cache=True)
+def _heap_pop(keys, nodes, size):
+    """Remove the root of the heap; the caller reads keys[0], nodes[0] first"""
+    size -= 1
+    key = keys[size]
+    node = nodes[size]
+    i = 0
+    while True:
+        child = 2 * i + 1
+        if child >= size:
+            break
+        if child + 1 < size and keys[child + 1] < keys[child]:
+            child += 1
+        if key <= keys[child]:
+            break
+        keys[i] = keys[child]
+        nodes[i] = nodes[child]
+        i = child
+    if size > 0:
+        keys[i] = key
+        nodes[i] = node
+    return size
+
+
+@njit(cache=True)
+def _dijkstra_kernel(indptr, indices, w, start, end, scratch):
+    """Shared search loop; end = -1 settles every reachable node"""
+    parents, costs, settled, heap_keys, heap_nodes = scratch
+    parents.fill(-1)
+    costs.fill(np.inf)
+    settled.fill(0)
+
+    costs[start] = 0.0
+    size = _heap_push(heap_keys, heap_nodes, 0, 0.0, start)
+    nodes_explored = 0
+
+    while size > 0:
+        current_cost = heap_keys[0]
+        current_node = heap_nodes[0]
+        size = _heap_pop(heap_keys, heap_nodes, size)
+
+        if settled[current_node]:
+            continue
+
+        settled[current_node] = 1
+        nodes_explored += 1
+
+        if current_node == end:
+            break
+
+        for k in range(indptr[current_node], indptr[current_node + 1]):
+            neighbor = indices[k]
+            if settled[neighbor]:
+                continue
+
+            new_cost = current_cost + w[k]
+            if new_cost < costs[neighbor]:
+                costs[neighbor] = new_cost
+                parents[neighbor] = current_node
+                size = _heap_push(heap_keys, heap_nodes, size, new_cost, neighbor)
+
+    return parents, costs, nodes_explored
+
+
+@njit(cache=True, nogil=True)
+def dijkstra_csr(indptr, indices, w, start, end, scratch):
+    """
+    Dijkstra's algorithm on a CSR graph
+
+    Args:
+        indptr: Edge offsets, the out-edges of u are indptr[u]:indptr[u + 1]
+        indices: Edge targets
+        w: Edge weights for the chosen metric
+        start: Starting node index
+        end: Destination node index
+        scratch: Work arrays (parents, costs, settled, heap_keys, heap_nodes), reset
+                 here on every call. parents, costs and settled have one slot per
+                 node; the heap arrays need one slot per edge plus one, since every
+                 push follows a strict improvement along a distinct edge.
+
+    Returns:
+        Tuple of (parents, cost, nodes_explored); parents is the scratch array and
+        cost is inf if end is unreachable
+    """
+    parents, costs, nodes_explored = _dijkstra_kernel(indptr, indices, w, start, end, scratch)
+    return parents, costs[end], nodes_explored
+
+
+@njit(cache=True, nogil=True)
+def dijkstra_one_to_all_csr(indptr, indices, w, start, scratch):
+    """
+    Dijkstra's algorithm from start to every node of a CSR graph
+
+    Returns:
+        Tuple of (costs, parents), both scratch arrays; unreachable nodes have
+        cost inf and parent -1
+    """
+    parents, costs, _ = _dijkstra_kernel(indptr, indices, w, start, -1, scratch)
+    return costs, parents
+
+
+# Radix heap ---------------------------------------------------------------------
+# Dijkstra only ever extracts non-decreasing keys, so with integer weights a radix
+# heap gives O(1) amortized push and pop. Entries sit in singly linked lists, one
+# per bucket, held in preallocated arrays. Bucket b holds keys whose highest bit
+# differing from the last extracted minimum is bit b - 1. Bucket 0 holds keys
+# equal to that minimum.
+
+RADIX_BUCKETS = 65
+_UNREACHED = np.iinfo(np.int64).max
+
+
+@njit(cache=True)
+def _bit_length(x):
+    """Number of bits needed to represent a non-negative integer"""
+    length = 0
+    if x >= 1 << 32:
+        x >>= 32
+        length += 32
+    if x >= 1 << 16:
+        x >>= 16
+        length += 16
+    if x >= 1 << 8:
+        x >>= 8
+        length += 8
+    while x:
+        x >>= 1
+        length += 1
+    return length
+
+
+@njit(cache=True)
+def _dijkstra_radix_kernel(indptr, indices, qw, start, end, scratch):
+    """Radix heap search loop over integer weights; end = -1 settles every reachable node"""
+    parents, costs, settled, entry_keys, entry_nodes, entry_next, heads = scratch
+    parents.fill(-1)
+    costs.fill(_UNREACHED)
+    settled.fill(0)
+    heads.fill(-1)
+
+    costs[start] = 0
+    entry_keys[0] = 0
+    entry_nodes[0] = start
+    entry_next[0] = -1
+    heads[0] = 0
+    last = 0
+    pushed = 1
+    size = 1
+    nodes_explored = 0
+
+    while size > 0:
+        if heads[0] == -1:
+            # Refill bucket 0 from the first non-empty bucket: its minimum becomes
+            # the new reference and every entry lands in a strictly lower bucket
+            bucket = 1
+            while heads[bucket] == -1:
+                bucket += 1
+
+            entry = heads[bucket]
+            last = entry_keys[entry]
+            while entry != -1:
+                if entry_keys[entry] < last:
+                    last = entry_keys[entry]
+                entry = entry_next[entry]
+
+            entry = heads[bucket]
+            heads[bucket] = -1
+            while entry != -1:
+                following = entry_next[entry]
+                target = _bit_length(entry_keys[entry] ^ last)
+                entry_next[entry] = heads[target]
+                heads[target] = entry
+                entry = following
+
+        entry = heads[0]
+        heads[0] = entry_next[entry]
+        size -= 1
+        current_cost = entry_keys[entry]
+        current_node = entry_nodes[entry]
+
+        if settled[current_node]:
+            continue
+
+        settled[current_node] = 1
+        nodes_explored += 1
+
+        if current_node == end:
+            break
+
+        for k in range(indptr[current_node], indptr[current_node + 1]):
+            neighbor = indices[k]
+            if settled[neighbor]:
+                continue
+
+            new_cost = current_cost + qw[k]
+            if new_cost < costs[neighbor]:
+                costs[neighbor] = new_cost
+                parents[neighbor] = current_node
+                bucket = _bit_length(new_cost ^ last)
+                entry_keys[pushed] = new_cost
+                entry_nodes[pushed] = neighbor
+                entry_next[pushed] = heads[bucket]
+                heads[bucket] = pushed
+                pushed += 1
+                size += 1
+
+    return parents, costs, nodes_explored
+
+
+@njit(cache=True, nogil=True)
+def dijkstra_radix_csr(indptr, indices, qw, start, end, scratch):
+    """
+    Dijkstra's algorithm on a CSR graph with non-negative integer weights,
+    using a radix heap
+
+    Args:
+        scratch: Work arrays (parents, costs, settled, entry_keys, entry_nodes,
+                 entry_next, heads), reset here on every call. costs is int64 per
+                 node, the entry arrays have one slot per edge plus one and heads
+                 has RADIX_BUCKETS slots.
+
+    Returns:
+        Tuple of (parents, cost, nodes_explored); parents is the scratch array and
+        cost is -1 if end is unreachable
+    """
+    parents, costs, nodes_explored = _dijkstra_radix_kernel(indptr, indices, qw, start, end, scratch)
+    cost = costs[end]
+    if cost == _UNREACHED:
+        cost = -1
+    return parents, cost, nodes_explored
+
+
+@njit(cache=True, nogil=True)
+def dijkstra_one_to_all_radix_csr(indptr, indices, qw, start, scratch):
+    """
+    Radix heap Dijkstra from start to every node of a CSR graph with integer weights
+
+    Returns:
+        Tuple of (costs, parents), both scratch arrays; unreachable nodes have
+        cost -1 and parent -1
+    """
+    parents, costs, _ = _dijkstra_radix_kernel(indptr, indices, qw, start, -1, scratch)
+    for i in range(costs.shape[0]):
+        if costs[i] == _UNREACHED:
+            costs[i] = -1
+    return costs, parents
+
+
+# A* and bidirectional search ------------------------------------------------------
+# These heaps order entries by (key, tiebreak, sequence) like the Python loops'
+# heap tuples, so the compiled searches expand nodes in the same order.
+
+@njit(cache=True)
+def _entry_before(keys, ties, seqs, i, key, tie, seq):
+    """Whether heap slot i sorts strictly before the entry (key, tie, seq)"""
+    if keys[i] != key:
+        return keys[i] < key
+    if ties[i] != tie:
+        return ties[i] < tie
+    return seqs[i] < seq
+
+
+@njit(cache=True)
+def _lex_heap_push(keys, ties, seqs, nodes, size, key, tie, seq, node):
+    """Push an entry onto a min-heap of (key, tie, seq) stored in parallel arrays"""
+    i = size
+    while i > 0:
+        parent = (i - 1) >> 1
+        if _entry_before(keys, ties, seqs, parent, key, tie, seq):
+            break
+        keys[i] = keys[parent]
+        ties[i] = ties[parent]
+        seqs[i] = seqs[parent]
+        nodes[i] = nodes[parent]
+        i = parent
+    keys[i] = key
+    ties[i] = tie
+    seqs[i] = seq
+    nodes[i] = node
+    return size + 1
+
+
+@njit(cache=True)
+def _lex_heap_pop(keys, ties, seqs, nodes, size):
+    """Remove the root of the heap; the caller reads slot 0 first"""
+    size -= 1
+    key = keys[size]
+    tie = ties[size]
+    seq = seqs[size]
+    node = nodes[size]
+    i = 0
+    while True:
+        child = 2 * i + 1
+        if child >= size:
+            break
+        if child + 1 < size and _entry_before(keys, ties, seqs, child + 1, keys[child], ties[child], seqs[child]):
+            child += 1
+        if not _entry_before(keys, ties, seqs, child, key, tie, seq):
+            break
+        keys[i] = keys[child]
+        ties[i] = ties[child]
+        seqs[i] = seqs[child]
+        nodes[i] = nodes[child]
+        i = child
+    if size > 0:
+        keys[i] = key
+        ties[i] = tie
+        seqs[i] = seq
+        nodes[i] = node
+    return size
+
+
+@njit(cache=True)
+def _straight_line(lat, lon, node, target_lat, target_lon, k):
+    """Equirectangular angle between a node and a target whose cos(lat) is k"""
+    dy = lat[node] - target_lat
+    dx = (lon[node] - target_lon) * k
+    return np.sqrt(dx * dx + dy * dy)
+
+
+@njit(cache=True)
+def _potential(lat, lon, scale, node, start_lat, start_lon, k_start, end_lat, end_lon, k_end):
+    """Average of the heuristics towards end and from start"""
+    to_end = scale * _straight_line(lat, lon, node, end_lat, end_lon, k_end)
+    from_start = scale * _straight_line(lat, lon, node, start_lat, start_lon, k_start)
+    return (to_end - from_start) / 2
+
+
+@njit(cache=True, nogil=True)
+def a_star_csr(indptr, indices, w, lat, lon, scale, start, end, scratch):
+    """
+    A* on a CSR graph with an equirectangular heuristic
+
+    Args:
+        lat, lon: Heuristic node positions in radians
+        scale: Metric cost per radian of straight-line distance
+        scratch: Work arrays (parents, g_scores, settled, heap_keys, heap_ties,
+                 heap_seqs, heap_nodes), reset here on every call. The heap arrays
+                 need one slot per edge plus one.
+
+    Returns:
+        Tuple of (parents, cost, nodes_explored); parents is the scratch array and
+        cost is inf if end is unreachable
+    """
+    parents, g_scores, settled, heap_keys, heap_ties, heap_seqs, heap_nodes = scratch
+    parents.fill(-1)
+    g_scores.fill(np.inf)
+    settled.fill(0)
+
+    target_lat = lat[end]
+    target_lon = lon[end]
+    k = np.cos(target_lat)
+
+    # Entries are (f, -g, insertion order): ties on f go to the larger g
+    g_scores[start] = 0.0
+    size = _lex_heap_push(heap_keys, heap_ties, heap_seqs, heap_nodes, 0, 0.0, -0.0, 0, start)
+    pushed = 1
+    nodes_explored = 0
+
+    while size > 0:
+        g_score = -heap_ties[0]
+        current_node = heap_nodes[0]
+        size = _lex_heap_pop(heap_keys, heap_ties, heap_seqs, heap_nodes, size)
+
+        if settled[current_node]:
+            continue
+
+        settled[current_node] = 1
+        nodes_explored += 1
+
+        if current_node == end:
+            return parents, g_score, nodes_explored
+
+        for e in range(indptr[current_node], indptr[current_node + 1]):
+            neighbor = indices[e]
+            if settled[neighbor]:
+                continue
+
+            tentative_g = g_score + w[e]
+            if tentative_g < g_scores[neighbor]:
+                g_scores[neighbor] = tentative_g
+                parents[neighbor] = current_node
+                f_score = tentative_g + scale * _straight_line(lat, lon, neighbor, target_lat, target_lon, k)
+                size = _lex_heap_push(heap_keys, heap_ties, heap_seqs, heap_nodes, size,
+                                      f_score, -tentative_g, pushed, neighbor)
+                pushed += 1
+
+    return parents, np.inf, nodes_explored
+
+
+@njit(cache=True, nogil=True)
+def bidirectional_csr(indptr, indices, w, indptr_r, indices_r, w_r, lat, lon, scale, start, end, scratch):
+    """
+    Bidirectional Dijkstra, or bidirectional A* when scale > 0, on a CSR graph and
+    its reverse. The potential is the average of the forward and backward
+    equirectangular heuristics.
+
+    Args:
+        lat, lon: Heuristic node positions in radians
+        scale: Metric cost per radian of straight-line distance, 0 for plain Dijkstra
+        scratch: Work arrays (parents, costs, settled, heap_keys, heap_ties,
+                 heap_seqs, heap_nodes), each with one row per direction, reset
+                 here on every call. Heap rows need one slot per edge plus one.
+
+    Returns:
+        Tuple of (forward parents, backward parents, cost, meeting node,
+        nodes_explored); cost is inf and the meeting node -1 if end is unreachable
+    """
+    parents, costs, settled, heap_keys, heap_ties, heap_seqs, heap_nodes = scratch
+    parents.fill(-1)
+    costs.fill(np.inf)
+    settled.fill(0)
+
+    start_lat = lat[start]
+    start_lon = lon[start]
+    end_lat = lat[end]
+    end_lon = lon[end]
+    k_start = np.cos(start_lat)
+    k_end = np.cos(end_lat)
+
+    # Entries are (key, 0, node) to match the Python loop's (key, node) tuples
+    sizes = np.zeros(2, dtype=np.int64)
+    p_start = _potential(lat, lon, scale, start, start_lat, start_lon, k_start, end_lat, end_lon, k_end)
+    p_end = _potential(lat, lon, scale, end, start_lat, start_lon, k_start, end_lat, end_lon, k_end)
+    sizes[0] = _lex_heap_push(heap_keys[0], heap_ties[0], heap_seqs[0], heap_nodes[0], 0, p_start, 0.0, start, start)
+    sizes[1] = _lex_heap_push(heap_keys[1], heap_ties[1], heap_seqs[1], heap_nodes[1], 0, -p_end, 0.0, end, end)
+    costs[0, start] = 0.0
+    costs[1, end] = 0.0
+    nodes_explored = 0
+
+    best_cost = np.inf
+    meeting_node = -1
+    if start == end:
+        best_cost = 0.0
+        meeting_node = start
+
+    while sizes[0] > 0 and sizes[1] > 0:
+        if heap_keys[0, 0] + heap_keys[1, 0] >= best_cost:
+            break
+
+        # Expand the side with the smaller top key, the smaller frontier on ties
+        if heap_keys[0, 0] != heap_keys[1, 0]:
+            side = 0 if heap_keys[0, 0] < heap_keys[1, 0] else 1
+        else:
+            side = 0 if sizes[0] <= sizes[1] else 1
+
+        if side == 0:
+            side_indptr = indptr
+            side_indices = indices
+            side_w = w
+            sign = 1.0
+        else:
+            side_indptr = indptr_r
+            side_indices = indices_r
+            side_w = w_r
+            sign = -1.0
+        keys = heap_keys[side]
+        ties = heap_ties[side]
+        seqs = heap_seqs[side]
+        nodes = heap_nodes[side]
+        side_costs = costs[side]
+        other_costs = costs[1 - side]
+        side_settled = settled[side]
+        side_parents = parents[side]
+
+        current_node = nodes[0]
+        sizes[side] = _lex_heap_pop(keys, ties, seqs, nodes, sizes[side])
+
+        if side_settled[current_node]:
+            continue
+
+        side_settled[current_node] = 1
+        nodes_explored += 1
+        current_cost = side_costs[current_node]
+
+        for e in range(side_indptr[current_node], side_indptr[current_node + 1]):
+            neighbor = side_indices[e]
+            if side_settled[neighbor]:
+                continue
+
+            new_cost = current_cost + side_w[e]
+            if new_cost < side_costs[neighbor]:
+                side_costs[neighbor] = new_cost
+                side_parents[neighbor] = current_node
+                potential = _potential(lat, lon, scale, neighbor, start_lat, start_lon, k_start,
+                                       end_lat, end_lon, k_end)
+                sizes[side] = _lex_heap_push(keys, ties, seqs, nodes, sizes[side],
+                                             new_cost + sign * potential, 0.0, neighbor, neighbor)
+
+            total_cost = side_costs[neighbor] + other_costs[neighbor]
+            if total_cost < best_cost:
+                best_cost = total_cost
+                meeting_node = neighbor
+
+    return parents[0], parents[1], best_cost, meeting_node, nodes_explored
@@ -1,6 +1,12 @@
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, Response, render_template, jsonify, request
 from flask_cors import CORS
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Tuple
+import orjson
+import os
 import random
+import threading
 from algorithms import RouteOptimizer
 from graph_generator import GraphGenerator
 
@@ -12,10 +18,22 @@ graph_data = None
 positions_data = None
 road_geometries = None
 optimizer = None
+_node_list = None
+_graph_payload = None
+_graph_lock = threading.Lock()
+
+# Genetic algorithm sub-populations, one worker process per core up to four
+GA_ISLANDS = min(4, os.cpu_count() or 1)
+
+ALGORITHMS = ('dijkstra', 'astar', 'bidijkstra', 'biastar', 'genetic')
+
+# /api/compare runs its algorithms side by side: the compiled kernels release the
+# GIL and the genetic algorithm evolves in its island worker processes
+_compare_pool = ThreadPoolExecutor(max_workers=3)
 
 def initialize_graph():
     """Initialize the graph with sample data"""
-    global graph_data, positions_data, road_geometries, optimizer
+    global graph_data, positions_data, road_geometries, optimizer, _node_list, _graph_payload
     
     # Try to generate graph with real OSM data first
     print("Attempting to fetch real OpenStreetMap data...")
@@ -26,21 +44,11 @@ def initialize_graph():
     )
     
     # If OSM fails, it will automatically fallback to synthetic graph
+    previous_optimizer = optimizer
     optimizer = RouteOptimizer(graph_data)
-    print(f"Graph initialized with {len(graph_data)} nodes")
-
-@app.route('/')
-def index():
-    """Serve the main dashboard page"""
-    return render_template('index.html')
-
-@app.route('/api/graph', methods=['GET'])
-def get_graph():
-    """Return the graph structure and positions"""
-    if graph_data is None:
-        initialize_graph()
+    _node_list = list(graph_data.keys())
     
-    # Convert graph to serializable format
+    # The graph never changes after this point, so /api/graph serves these bytes as-is
     serializable_graph = {}
     for node, neighbors in graph_data.items():
         serializable_graph[node] = {
@@ -50,13 +58,104 @@ def get_graph():
             }
             for neighbor, edge_data in neighbors.items()
         }
-    
-    return jsonify({
+    _graph_payload = orjson.dumps({
         'graph': serializable_graph,
         'positions': positions_data,
-        'nodes': list(graph_data.keys())
+        'nodes': _node_list
+    })
+    
+    # Results cached for a previous graph are stale; the synthetic graph reuses node IDs
+    route_result.cache_clear()
+    optimize_body.cache_clear()
+    if previous_optimizer is not None:
+        previous_optimizer.close()
+    print(f"Graph initialized with {len(graph_data)} nodes")
+
+def ensure_graph():
+    """Initialize the graph on first use; concurrent first requests wait for a single build"""
+    if _graph_payload is None:
+        with _graph_lock:
+            if _graph_payload is None:
+                initialize_graph()
+
+def json_response(body: bytes) -> Response:
+    """Wrap serialized JSON in a response"""
+    return Response(body, mimetype='application/json')
+
+def to_json(payload) -> bytes:
+    """Serialize with orjson, which is faster than jsonify and handles numpy types"""
+    return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+
+def run_algorithm(algorithm: str, start: str, end: str, waypoints: List[str],
+                  metric: str) -> Tuple[List[str], float, Dict]:
+    """Run one of ALGORITHMS and return its (path, cost, stats)"""
+    if algorithm == 'dijkstra':
+        return optimizer.dijkstra(start, end, metric)
+    if algorithm == 'astar':
+        return optimizer.a_star(start, end, positions_data, metric)
+    if algorithm == 'bidijkstra':
+        return optimizer.bidirectional_dijkstra(start, end, metric)
+    if algorithm == 'biastar':
+        return optimizer.bidirectional_a_star(start, end, positions_data, metric)
+    if algorithm == 'genetic':
+        return optimizer.genetic_algorithm(
+            start, end, waypoints, metric,
+            population_size=50,
+            generations=100,
+            mutation_rate=0.2,
+            islands=GA_ISLANDS
+        )
+    raise ValueError(f"Unknown algorithm '{algorithm}'")
+
+# The graph is fixed once initialized, so identical requests can share results.
+# Exceptions are not cached, so a failed run is retried on the next request.
+@lru_cache(maxsize=1024)
+def route_result(algorithm: str, start: str, end: str, waypoints: Tuple[str, ...], metric: str) -> Dict:
+    """Cached result of one algorithm with its path coordinates; callers must not modify it"""
+    path, cost, stats = run_algorithm(algorithm, start, end, list(waypoints), metric)
+    return {
+        'path': path,
+        'cost': cost,
+        'stats': stats,
+        'coordinates': [
+            {'lat': positions_data[node][0], 'lon': positions_data[node][1], 'node': node}
+            for node in path
+        ] if path else []
+    }
+
+def waypoint_key(algorithm: str, waypoints) -> Tuple[str, ...]:
+    """Cache key for the waypoints; only the genetic algorithm visits them"""
+    return tuple(waypoints) if algorithm == 'genetic' else ()
+
+def compare_result(algorithm: str, start: str, end: str, waypoints, metric: str) -> Dict:
+    """route_result for one /api/compare algorithm, run on the compare pool"""
+    return route_result(algorithm, start, end, waypoint_key(algorithm, waypoints), metric)
+
+@lru_cache(maxsize=1024)
+def optimize_body(algorithm: str, start: str, end: str, waypoints: Tuple[str, ...], metric: str) -> bytes:
+    """Cached /api/optimize response body"""
+    result = route_result(algorithm, start, end, waypoints, metric)
+    return to_json({
+        'path': result['path'],
+        'cost': result['cost'],
+        'metric': metric,
+        'stats': result['stats'],
+        'coordinates': result['coordinates'],
+        'algorithm': algorithm
     })
 
+@app.route('/')
+def index():
+    """Serve the main dashboard page"""
+    return render_template('index.html')
+
+@app.route('/api/graph', methods=['GET'])
+def get_graph():
+    """Return the graph structure and positions"""
+    ensure_graph()
+    
+    return json_response(_graph_payload)
+
 @app.route('/api/optimize', methods=['POST'])
 def optimize_route():
     """
@@ -64,21 +163,20 @@ def optimize_route():
     
     Expected JSON payload:
     {
-        "algorithm": "dijkstra" | "astar" | "genetic",
+        "algorithm": "dijkstra" | "astar" | "bidijkstra" | "biastar" | "genetic",
         "start": "node_id",
         "end": "node_id",
         "waypoints": ["node_id1", "node_id2", ...],
         "metric": "distance" | "time"
     }
     """
-    if graph_data is None:
-        initialize_graph()
+    ensure_graph()
     
     data = request.get_json()
     algorithm = data.get('algorithm', 'dijkstra').lower()
     start = data.get('start')
     end = data.get('end')
-    waypoints = data.get('waypoints', [])
+    waypoints = data.get('waypoints') or []
     metric = data.get('metric', 'distance')
     
     # Validate inputs
@@ -88,38 +186,11 @@ def optimize_route():
     if start not in graph_data or end not in graph_data:
         return jsonify({'error': 'Invalid start or end node'}), 400
     
-    try:
-        if algorithm == 'dijkstra':
-            path, cost, stats = optimizer.dijkstra(start, end, metric)
-        elif algorithm == 'astar':
-            path, cost, stats = optimizer.a_star(start, end, positions_data, metric)
-        elif algorithm == 'genetic':
-            path, cost, stats = optimizer.genetic_algorithm(
-                start, end, waypoints, metric,
-                population_size=50,
-                generations=100,
-                mutation_rate=0.2
-            )
-        else:
-            return jsonify({'error': 'Invalid algorithm'}), 400
-        
-        # Calculate path coordinates
-        path_coordinates = []
-        if path:
-            path_coordinates = [
-                {'lat': positions_data[node][0], 'lon': positions_data[node][1], 'node': node}
-                for node in path
-            ]
-        
-        return jsonify({
-            'path': path,
-            'cost': cost,
-            'metric': metric,
-            'stats': stats,
-            'coordinates': path_coordinates,
-            'algorithm': algorithm
-        })
+    if algorithm not in ALGORITHMS:
+        return jsonify({'error': 'Invalid algorithm'}), 400
     
+    try:
+        return json_response(optimize_body(algorithm, start, end, waypoint_key(algorithm, waypoints), metric))
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -136,90 +207,47 @@ def compare_algorithms():
         "metric": "distance" | "time"
     }
     """
-    if graph_data is None:
-        initialize_graph()
+    ensure_graph()
     
     data = request.get_json()
     start = data.get('start')
     end = data.get('end')
-    waypoints = data.get('waypoints', [])
+    waypoints = data.get('waypoints') or []
     metric = data.get('metric', 'distance')
     
     # Validate inputs
     if not start or not end:
         return jsonify({'error': 'Start and end nodes are required'}), 400
     
-    results = {}
-    
-    # Run Dijkstra
-    try:
-        path, cost, stats = optimizer.dijkstra(start, end, metric)
-        results['dijkstra'] = {
-            'path': path,
-            'cost': cost,
-            'stats': stats,
-            'coordinates': [
-                {'lat': positions_data[node][0], 'lon': positions_data[node][1], 'node': node}
-                for node in path
-            ] if path else []
-        }
-    except Exception as e:
-        results['dijkstra'] = {'error': str(e)}
-    
-    # Run A*
-    try:
-        path, cost, stats = optimizer.a_star(start, end, positions_data, metric)
-        results['astar'] = {
-            'path': path,
-            'cost': cost,
-            'stats': stats,
-            'coordinates': [
-                {'lat': positions_data[node][0], 'lon': positions_data[node][1], 'node': node}
-                for node in path
-            ] if path else []
-        }
-    except Exception as e:
-        results['astar'] = {'error': str(e)}
+    # Run Dijkstra and A*, plus the Genetic Algorithm if waypoints were provided
+    names = ['dijkstra', 'astar'] + (['genetic'] if waypoints else [])
+    futures = {
+        name: _compare_pool.submit(compare_result, name, start, end, waypoints, metric)
+        for name in names
+    }
     
-    # Run Genetic Algorithm (only if waypoints provided)
-    if waypoints:
+    results = {}
+    for name, future in futures.items():
         try:
-            path, cost, stats = optimizer.genetic_algorithm(
-                start, end, waypoints, metric,
-                population_size=50,
-                generations=100,
-                mutation_rate=0.2
-            )
-            results['genetic'] = {
-                'path': path,
-                'cost': cost,
-                'stats': stats,
-                'coordinates': [
-                    {'lat': positions_data[node][0], 'lon': positions_data[node][1], 'node': node}
-                    for node in path
-                ] if path else []
-            }
+            results[name] = future.result()
         except Exception as e:
-            results['genetic'] = {'error': str(e)}
+            results[name] = {'error': str(e)}
     
-    return jsonify({
+    return json_response(to_json({
         'metric': metric,
         'results': results
-    })
+    }))
 
 @app.route('/api/random-nodes', methods=['GET'])
 def get_random_nodes():
     """Get random start, end, and waypoint nodes"""
-    if graph_data is None:
-        initialize_graph()
+    ensure_graph()
     
     num_waypoints = int(request.args.get('waypoints', 2))
-    nodes = list(graph_data.keys())
-    
-    if len(nodes) < num_waypoints + 2:
+    if len(_node_list) < num_waypoints + 2:
         return jsonify({'error': 'Not enough nodes in graph'}), 400
     
-    selected = random.sample(nodes, num_waypoints + 2)
+    selected = random.sample(_node_list, num_waypoints + 2)
     
     return jsonify({
         'start': selected[0],
@@ -1,6 +1,6 @@
 import random
-import math
 import json
+import numpy as np
 from typing import Dict, Tuple, List
 
 class GraphGenerator:
@@ -134,21 +134,25 @@ class GraphGenerator:
         # Create connections based on proximity
         node_list = list(graph.keys())
         
+        # Haversine distances between all pairs of nodes in one vectorized pass
+        all_distances = GraphGenerator._pairwise_haversine_distances(
+            [positions[node] for node in node_list]
+        )
+        np.fill_diagonal(all_distances, np.inf)
+        
         for i, node1 in enumerate(node_list):
-            # Calculate distances to all other nodes
-            distances = []
-            for j, node2 in enumerate(node_list):
-                if i != j:
-                    dist = GraphGenerator._haversine_distance(
-                        positions[node1], positions[node2]
-                    )
-                    distances.append((node2, dist))
-            
-            # Sort by distance and connect to nearest neighbors
-            distances.sort(key=lambda x: x[1])
+            # Connect to nearest neighbors
             num_connections = max(2, int(num_nodes * density * random.uniform(0.5, 1.5)))
-            
-            for node2, dist in distances[:num_connections]:
+            row = all_distances[i]
+            k = min(num_connections, len(node_list) - 1)
+            if k <= 0:
+                continue
+            nearest = np.argpartition(row, k - 1)[:k]
+            nearest = nearest[np.argsort(row[nearest], kind='stable')]
+            
+            for j in nearest:
+                node2 = node_list[j]
+                dist = float(row[j])
                 if node2 not in graph[node1]:
                     # Calculate realistic travel time (assume 40 km/h average speed)
                     avg_speed_kmh = random.uniform(30, 50)
@@ -184,35 +188,28 @@ class GraphGenerator:
         return graph, positions, road_geometries
     
     @staticmethod
-    def _haversine_distance(coord1: Tuple[float, float], 
-                           coord2: Tuple[float, float]) -> float:
+    def _pairwise_haversine_distances(coords: List[Tuple[float, float]]) -> np.ndarray:
         """
-        Calculate distance between two coordinates using Haversine formula
+        Calculate the Haversine distance between every pair of coordinates
         
         Args:
-            coord1: (latitude, longitude) of first point
-            coord2: (latitude, longitude) of second point
+            coords: List of (latitude, longitude) points
             
         Returns:
-            Distance in kilometers
+            Symmetric matrix of distances in kilometers
         """
-        lat1, lon1 = coord1
-        lat2, lon2 = coord2
-        
-        # Earth radius in kilometers
         R = 6371.0
         
-        # Convert to radians
-        lat1_rad = math.radians(lat1)
-        lat2_rad = math.radians(lat2)
-        delta_lat = math.radians(lat2 - lat1)
-        delta_lon = math.radians(lon2 - lon1)
+        points = np.radians(np.asarray(coords, dtype=np.float64).reshape(-1, 2))
+        lat = points[:, 0]
+        lon = points[:, 1]
         
-        # Haversine formula
-        a = math.sin(delta_lat/2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lon/2)**2
-        c = 2 * math.asin(math.sqrt(a))
+        delta_lat = lat[:, None] - lat[None, :]
+        delta_lon = lon[:, None] - lon[None, :]
+        a = np.sin(delta_lat/2)**2 + np.cos(lat)[:, None] * np.cos(lat)[None, :] * np.sin(delta_lon/2)**2
         
-        return R * c
+        # Clip guards against a creeping just above 1 from rounding
+        return 2 * R * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
     
     @staticmethod
     def get_sample_waypoints(positions: Dict[str, Tuple[float, float]], 
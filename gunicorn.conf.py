@@ -0,0 +1,26 @@
+import os
+
+# Production server settings, picked up automatically when running `gunicorn`
+# from the project directory. `python app.py` remains the development server.
+
+wsgi_app = 'app:app'
+bind = os.environ.get('BIND', '0.0.0.0:5000')
+
+# Route searches are CPU bound, so use one worker process per core, each with a
+# few threads for requests that wait on the GA island workers or the network
+workers = int(os.environ.get('WEB_CONCURRENCY', os.cpu_count() or 1))
+worker_class = 'gthread'
+threads = int(os.environ.get('THREADS', 4))
+
+# OSM downloads and the first Numba compilation can take a while
+timeout = 120
+
+# Load the app in the master and build the graph there before forking, so every
+# worker serves the same graph (the synthetic fallback is random) and the
+# download happens once
+preload_app = True
+
+
+def on_starting(server):
+    from app import initialize_graph
+    initialize_graph()
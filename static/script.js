@@ -15,6 +15,8 @@ const API_BASE = window.location.origin;
 const algorithmColors = {
   dijkstra: '#2563eb',
   astar: '#10b981',
+  bidijkstra: '#0ea5e9',
+  biastar: '#14b8a6',
   genetic: '#8b5cf6',
 };
 